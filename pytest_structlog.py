@@ -1,5 +1,4 @@
 import logging
-import os
 
 import pytest
 import structlog
@@ -13,6 +12,12 @@ except ImportError:
     merge_contextvars = object()
     clear_contextvars = lambda *a, **kw: None  # noqa
 
+try:
+    # Python 2: dict.items returns a list, the set-like view is viewitems
+    items_view = dict.viewitems
+except AttributeError:
+    items_view = dict.items
+
 
 __version__ = "0.6"
 
@@ -40,16 +45,57 @@ class EventList(list):
 
 absent = object()
 
+# level numbers for the method names used by structlog bound loggers
+_LEVEL_NO = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+
+# lower-case level names, keyed by level number and by upper/lower-case name
+_LEVEL_TO_NAME = {
+    logging.DEBUG: "debug",
+    logging.INFO: "info",
+    logging.WARNING: "warning",
+    logging.ERROR: "error",
+    logging.CRITICAL: "critical",
+}
+_STR_TO_NAME = {}
+for _name in _LEVEL_TO_NAME.values():
+    _STR_TO_NAME[_name] = _STR_TO_NAME[_name.upper()] = _name
+del _name
+
 
 def level_to_name(level):
     """Given the name or number for a log-level, return the lower-case level name."""
     if isinstance(level, str):
-        return level.lower()
-    return logging.getLevelName(level).lower()
+        name = _STR_TO_NAME.get(level)
+        return level.lower() if name is None else name
+    name = _LEVEL_TO_NAME.get(level)
+    return logging.getLevelName(level).lower() if name is None else name
+
+
+def level_to_number(level):
+    """Given the name or number for a log-level, return the level number."""
+    if isinstance(level, str):
+        if level.isdigit():
+            return int(level)
+        return logging.getLevelName(level.upper())
+    return level
 
 
 def is_submap(d1, d2):
     """is every pair from d1 also in d2? (unique and order insensitive)"""
+    try:
+        return items_view(d1) <= items_view(d2)
+    except TypeError:
+        # not a dict, e.g. some other mapping type used as structlog's context_class
+        pass
     return all(d2.get(k, absent) == v for k, v in d1.items())
 
 
@@ -60,10 +106,21 @@ def is_subseq(l1, l2):
 
 
 class StructuredLogCapture(object):
-    def __init__(self):
+    def __init__(self, min_level=None):
         self.events = EventList()
+        self._min_level_no = logging.NOTSET
+        if isinstance(min_level, str):
+            min_level = min_level.strip()
+        if min_level:
+            level_no = level_to_number(min_level)
+            if not isinstance(level_no, int):
+                raise ValueError("invalid structlog_min_capture_level: {!r}".format(min_level))
+            self._min_level_no = level_no
 
     def process(self, logger, method_name, event_dict):
+        # unknown method names (e.g. "msg") are always captured
+        if _LEVEL_NO.get(method_name, self._min_level_no) < self._min_level_no:
+            raise structlog.DropEvent
         event_dict["level"] = method_name
         self.events.append(event_dict)
         raise structlog.DropEvent
@@ -101,6 +158,29 @@ def no_op(*args, **kwargs):
     pass
 
 
+def pytest_addoption(parser):
+    parser.addini(
+        "structlog_min_capture_level",
+        help="events logged below this level (name or number) are not captured by the log fixture",
+        default=None,
+    )
+
+
+def kept_processors(processors):
+    """Return the processors from the user's structlog config which the log fixture keeps"""
+    kept = []
+    for processor in processors:
+        if isinstance(processor, structlog.stdlib.PositionalArgumentsFormatter):
+            # if there was a positional argument formatter in there, keep it there
+            # see https://github.com/wimglenn/pytest-structlog/issues/18
+            kept.append(processor)
+        elif processor is merge_contextvars:
+            # if merging contextvars, preserve
+            # see https://github.com/wimglenn/pytest-structlog/issues/20
+            kept.append(processor)
+    return kept
+
+
 @pytest.fixture
 def log(monkeypatch, request):
     """Fixture providing access to captured structlog events. Interesting attributes:
@@ -114,18 +194,8 @@ def log(monkeypatch, request):
     original_processors = structlog.get_config().get("processors", [])
 
     # redirect logging to log capture
-    cap = StructuredLogCapture()
-    new_processors = []
-    for processor in original_processors:
-        if isinstance(processor, structlog.stdlib.PositionalArgumentsFormatter):
-            # if there was a positional argument formatter in there, keep it there
-            # see https://github.com/wimglenn/pytest-structlog/issues/18
-            new_processors.append(processor)
-        elif processor is merge_contextvars:
-            # if merging contextvars, preserve
-            # see https://github.com/wimglenn/pytest-structlog/issues/20
-            new_processors.append(processor)
-    new_processors.append(cap.process)
+    cap = StructuredLogCapture(min_level=request.config.getini("structlog_min_capture_level"))
+    new_processors = kept_processors(original_processors) + [cap.process]
     structlog.configure(processors=new_processors, cache_logger_on_first_use=False)
     cap.original_configure = configure = structlog.configure
     cap.configure_once = structlog.configure_once
@@ -143,6 +213,9 @@ def log(monkeypatch, request):
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_call(item):
     yield
-    events = getattr(item, "structlog_events", [])
-    content = os.linesep.join([str(e) for e in events])
+    events = getattr(item, "structlog_events", None)
+    if not events:
+        # test didn't use the log fixture, or nothing was logged
+        return
+    content = "\n".join(map(str, events))
     item.add_report_section("call", "structlog", content)
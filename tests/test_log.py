@@ -1,9 +1,17 @@
 import logging
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # Python 2
+    from collections import Mapping
+
 import pytest
 import structlog
 
 
+pytest_plugins = "pytester"
+
 logger = structlog.get_logger("test")
 
 
@@ -173,3 +181,85 @@ def test_dynamic_event_factory(log, level, name):
 
 def test_event_factory__bad_level_number(log):
     assert log.log(1234, "text") == {'event': 'text', 'level': 'level 1234'}
+
+
+def test_assert_with_unhashable_context(log):
+    logger.info("listed", items=[1, 2], more={"k": "v"})
+    assert log.has("listed", items=[1, 2])
+    assert log.has("listed", items=[1, 2], more={"k": "v"})
+    assert not log.has("listed", items=[1, 2, 3])
+
+
+class MappingEvent(Mapping):
+    """An event which is a Mapping but not a dict"""
+
+    def __init__(self, *args, **kwargs):
+        self._data = dict(*args, **kwargs)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
+def test_assert_with_non_dict_event(log):
+    log.events.append(MappingEvent(event="mapped", level="info", items=[1, 2]))
+    assert log.has("mapped")
+    assert log.has("mapped", level="info", items=[1, 2])
+    assert not log.has("mapped", level="debug")
+    assert not log.has("mapped", k="v")
+
+
+MIN_LEVEL_TEST = """
+import structlog
+
+logger = structlog.get_logger()
+
+def test_levels(log):
+    logger.debug("dbg")
+    logger.info("inf")
+    logger.warning("wrn")
+    logger.error("err")
+    assert log.events == {expected!r}
+"""
+
+
+@pytest.mark.parametrize("ini_value", ["warning", "WARNING", "30", " warning "])
+def test_min_capture_level_ini(testdir, ini_value):
+    testdir.makeini("[pytest]\nstructlog_min_capture_level = {}\n".format(ini_value))
+    expected = [
+        {"event": "wrn", "level": "warning"},
+        {"event": "err", "level": "error"},
+    ]
+    testdir.makepyfile(MIN_LEVEL_TEST.format(expected=expected))
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_min_capture_level_default_captures_everything(testdir):
+    expected = [
+        {"event": "dbg", "level": "debug"},
+        {"event": "inf", "level": "info"},
+        {"event": "wrn", "level": "warning"},
+        {"event": "err", "level": "error"},
+    ]
+    testdir.makepyfile(MIN_LEVEL_TEST.format(expected=expected))
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_min_capture_level_invalid(testdir):
+    testdir.makeini("[pytest]\nstructlog_min_capture_level = bogus\n")
+    testdir.makepyfile(MIN_LEVEL_TEST.format(expected=[]))
+    result = testdir.runpytest()
+    assert result.ret != 0
+    result.stdout.fnmatch_lines(["*ValueError: invalid structlog_min_capture_level: 'bogus'"])
+
+
+def test_superset_of_iterator(log):
+    binding()
+    assert log.events >= iter([d0, d2])